@@ -14,8 +14,9 @@ Highscore saved to: block_puzzle_highscore.json
 Optional assets folder: put sounds in ./assets/ (place.wav, clear.wav) to enable sfx
 """
 
-import pygame, random, json, os, sys, math
-from collections import deque
+import pygame, random, json, os, sys, math, functools
+import numpy as np
+from collections import deque, namedtuple
 
 # ----------------------- Config -----------------------
 SCREEN_W, SCREEN_H = 760, 860
@@ -64,9 +65,40 @@ PIECES = [
     # you can add more shapes
 ]
 
-# choose random pieces for new preview set
-def random_piece():
-    return [row[:] for row in random.choice(PIECES)]
+# ----------------------- Bitboard helpers -----------------------
+# The board occupancy lives in a single 100-bit Python int: bit (y*GRID_COLS + x)
+# is set iff cell (x, y) is occupied. Colors are kept separately (render only).
+FULL_ROW = (1 << GRID_COLS) - 1
+ROW_MASKS = [FULL_ROW << (y * GRID_COLS) for y in range(GRID_ROWS)]
+COL_BASE = sum(1 << (y * GRID_COLS) for y in range(GRID_ROWS))
+COL_MASKS = [COL_BASE << x for x in range(GRID_COLS)]
+
+def piece_mask(piece):
+    # 100-bit mask of the piece with its top-left at cell (0, 0)
+    return sum(1 << (y * GRID_COLS + x)
+               for y, row in enumerate(piece)
+               for x, c in enumerate(row) if c)
+
+# Immutable per-piece data, computed once at import. Pieces are referenced by
+# index into PIECE_DEFS everywhere in the game; PIECES stays as the source
+# matrices (and for the preview drawing).
+PieceDef = namedtuple("PieceDef", ["w", "h", "mask", "offsets", "fit_bits"])
+PIECE_DEFS = [
+    PieceDef(len(p[0]), len(p), piece_mask(p),
+             tuple((x, y) for y, row in enumerate(p) for x, c in enumerate(row) if c),
+             (1 << (GRID_COLS - len(p[0]) + 1)) - 1)
+    for p in PIECES
+]
+
+# every piece mask pre-shifted to every top-left position; entry
+# [piece][gy*GRID_COLS+gx] is None where the piece would overhang the board,
+# so a placement test is one table lookup plus one AND
+PIECE_MASK_AT = [
+    [pd.mask << (gy * GRID_COLS + gx)
+     if gx + pd.w <= GRID_COLS and gy + pd.h <= GRID_ROWS else None
+     for gy in range(GRID_ROWS) for gx in range(GRID_COLS)]
+    for pd in PIECE_DEFS
+]
 
 # ----------------------- Highscore utilities -----------------------
 def load_highscore():
@@ -95,6 +127,23 @@ FONT = pygame.font.SysFont(None, 22)
 BIG = pygame.font.SysFont(None, 36)
 TITLE = pygame.font.SysFont(None, 56)
 
+# font rendering allocates a Surface and rasterizes every call; cache the
+# results keyed by (font, text, color) since most HUD text rarely changes
+@functools.lru_cache(maxsize=64)
+def render_text(font, text, color):
+    return font.render(text, True, color)
+
+# menu options with click rects measured once; the event handler should not
+# rasterize text just to hit-test
+MENU_OPTIONS = ["Start", "Highscore", "Quit"]
+
+def _menu_rect(i, opt):
+    surf = render_text(BIG, opt, TEXT)
+    return pygame.Rect((SCREEN_W - surf.get_width())//2, 220 + i*86,
+                       surf.get_width(), surf.get_height())
+
+MENU_RECTS = [_menu_rect(i, opt) for i, opt in enumerate(MENU_OPTIONS)]
+
 # load optional sounds
 def load_sound(name):
     p = os.path.join(ASSETS, name)
@@ -108,103 +157,140 @@ def load_sound(name):
 SND_PLACE = load_sound("place.wav")
 SND_CLEAR = load_sound("clear.wav")
 
+# static board chrome (backing panel + empty-cell rounded rects + grid lines),
+# rendered once
+def make_board_surface():
+    w = GRID_COLS * CELL + 12
+    h = GRID_ROWS * CELL + 12
+    surf = pygame.Surface((w, h), pygame.SRCALPHA)
+    pygame.draw.rect(surf, BOARD_BG, (0, 0, w, h), border_radius=10)
+    for x in range(GRID_COLS):
+        for y in range(GRID_ROWS):
+            rect = pygame.Rect(6 + x*CELL + 3, 6 + y*CELL + 3, CELL-6, CELL-6)
+            pygame.draw.rect(surf, CELL_EMPTY, rect, border_radius=8)
+    for i in range(GRID_COLS+1):
+        pygame.draw.line(surf, LINE, (6 + i*CELL, 6), (6 + i*CELL, 6 + GRID_ROWS*CELL))
+    for j in range(GRID_ROWS+1):
+        pygame.draw.line(surf, LINE, (6, 6 + j*CELL), (6 + GRID_COLS*CELL, 6 + j*CELL))
+    return surf
+
+BOARD_SURF = make_board_surface()
+
+# one glossy filled-block sprite per color, baked once (no per-cell Surface
+# allocation or ellipse draw in the frame loop)
+def make_block_sprite(color):
+    size = CELL - 6
+    s = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.rect(s, color, (0, 0, size, size), border_radius=9)
+    inner = pygame.Rect(0, 0, size, size).inflate(-8, -8)
+    pygame.draw.ellipse(s, (255,255,255,26), (inner.x, inner.y, inner.w, inner.h//2))
+    return s
+
+BLOCK_SPRITES = [make_block_sprite(c) for c in PARTICLE_COLORS]
+
 # ----------------------- Game state classes -----------------------
-class Particle:
-    def __init__(self, x, y, color):
-        self.x = x; self.y = y
-        self.vx = random.uniform(-140,140)
-        self.vy = random.uniform(-260,-80)
-        self.life = random.uniform(0.45, 0.9)
-        self.color = color
-        self.size = random.uniform(3,6)
-    def update(self, dt):
-        self.vy += 700 * dt
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.life -= dt
-        self.size *= 0.99
-    def draw(self, surf):
-        if self.life>0:
-            r = max(1, int(self.size))
-            pygame.draw.circle(surf, self.color, (int(self.x), int(self.y)), r)
+# Particles live in struct-of-arrays NumPy buffers on the Game (x, y, vx, vy,
+# life, size, color index); updates run as vector ops over the live slice
+# instead of a Python method call per particle.
+PARTICLE_CAP = 512
 
 class Game:
     def __init__(self):
-        self.grid = [[0]*GRID_ROWS for _ in range(GRID_COLS)]  # 0 empty, >0 color index
+        self.occ = 0  # occupancy bitboard, bit (y*GRID_COLS+x) set iff occupied
+        self.color_grid = bytearray(GRID_COLS * GRID_ROWS)  # 0 empty, >0 color index (render only)
         self.score = 0
         self.highscore = load_highscore()
-        self.pieces = [random_piece(), random_piece(), random_piece()]
-        self.piece_colors = [random.randrange(len(PARTICLE_COLORS)) for _ in range(3)]
-        self.used = [False, False, False]
-        self.particles = []
+        self.spawn_new_triplet()
+        self.p_x = np.zeros(PARTICLE_CAP, np.float32)
+        self.p_y = np.zeros(PARTICLE_CAP, np.float32)
+        self.p_vx = np.zeros(PARTICLE_CAP, np.float32)
+        self.p_vy = np.zeros(PARTICLE_CAP, np.float32)
+        self.p_life = np.zeros(PARTICLE_CAP, np.float32)
+        self.p_size = np.zeros(PARTICLE_CAP, np.float32)
+        self.p_color = np.zeros(PARTICLE_CAP, np.int32)
+        self.p_count = 0
         self.game_over = False
+        # cached ghost placement (idx, gx, gy, mx, my); recomputed on mouse
+        # motion and after placements rather than every frame
+        self.ghost = None
+        # any_move_exists cache; dirty whenever occupancy or the piece set changes
+        self._moves_dirty = True
+        self._any_moves = True
+        # highscore writes are debounced: beat scores mark this dirty and the
+        # main loop / exit paths flush it, instead of JSON I/O per increment
+        self._hs_dirty = False
 
     def reset(self):
-        self.grid = [[0]*GRID_ROWS for _ in range(GRID_COLS)]
+        self.occ = 0
+        self.color_grid = bytearray(GRID_COLS * GRID_ROWS)
         self.score = 0
-        self.pieces = [random_piece(), random_piece(), random_piece()]
-        self.piece_colors = [random.randrange(len(PARTICLE_COLORS)) for _ in range(3)]
-        self.used = [False, False, False]
-        self.particles.clear()
+        self.spawn_new_triplet()
+        self.p_count = 0
         self.game_over = False
+        self.ghost = None
+        self._moves_dirty = True
+        self._any_moves = True
 
     def spawn_new_triplet(self):
-        self.pieces = [random_piece(), random_piece(), random_piece()]
-        self.piece_colors = [random.randrange(len(PARTICLE_COLORS)) for _ in range(3)]
+        rc = random.choices
+        self.pieces = rc(range(len(PIECE_DEFS)), k=3)
+        self.piece_colors = rc(range(len(PARTICLE_COLORS)), k=3)
         self.used = [False, False, False]
+        self._moves_dirty = True
 
-    def can_place_piece(self, piece, drop_x, drop_y):
-        # piece is matrix of rows; place top-left at drop_x, drop_y
-        h = len(piece)
-        w = len(piece[0])
-        if drop_x < 0 or drop_y < 0 or drop_x + w > GRID_COLS or drop_y + h > GRID_ROWS:
+    def can_place_piece(self, piece_idx, drop_x, drop_y):
+        # piece_idx indexes PIECE_DEFS; place top-left at drop_x, drop_y
+        if drop_x < 0 or drop_y < 0 or drop_x >= GRID_COLS or drop_y >= GRID_ROWS:
             return False
-        for px in range(w):
-            for py in range(h):
-                if piece[py][px]:
-                    if self.grid[drop_x+px][drop_y+py] != 0:
-                        return False
-        return True
+        mask = PIECE_MASK_AT[piece_idx][drop_y * GRID_COLS + drop_x]
+        return mask is not None and (self.occ & mask) == 0
 
     def any_valid_for_index(self, index):
         # check if piece at index (0..2) has any valid placement on grid
         if self.used[index]:
             return False
-        piece = self.pieces[index]
-        h = len(piece); w = len(piece[0])
-        for gx in range(GRID_COLS - w + 1):
-            for gy in range(GRID_ROWS - h + 1):
-                if self.can_place_piece(piece, gx, gy):
-                    return True
+        pd = PIECE_DEFS[self.pieces[index]]
+        occ = self.occ
+        fit_bits = pd.fit_bits
+        offsets = pd.offsets
+        cols = GRID_COLS
+        for gy in range(GRID_ROWS - pd.h + 1):
+            # bit gx of legal stays set while top-left (gx, gy) is collision-free;
+            # one shifted complement of occ per piece cell instead of a scan per gx
+            legal = fit_bits
+            for dx, dy in offsets:
+                legal &= ~(occ >> ((gy + dy) * cols + dx))
+                if not legal:
+                    break
+            if legal:
+                return True
         return False
 
     def any_move_exists(self):
-        # if any of the three has a possible place
-        for i in range(3):
-            if self.any_valid_for_index(i):
-                return True
-        return False
+        # if any of the three has a possible place (cached until the board
+        # or the piece set changes)
+        if self._moves_dirty:
+            self._any_moves = any(self.any_valid_for_index(i) for i in range(3))
+            self._moves_dirty = False
+        return self._any_moves
 
     def place_piece(self, index, gx, gy):
         if index < 0 or index > 2 or self.used[index]:
             return False
-        piece = self.pieces[index]
-        if not self.can_place_piece(piece, gx, gy):
+        if not self.can_place_piece(self.pieces[index], gx, gy):
             return False
-        color_id = self.piece_colors[index] + 1  # store 1..n in grid
-        placed_blocks = 0
-        for py in range(len(piece)):
-            for px in range(len(piece[0])):
-                if piece[py][px]:
-                    self.grid[gx+px][gy+py] = color_id
-                    placed_blocks += 1
+        pd = PIECE_DEFS[self.pieces[index]]
+        color_id = self.piece_colors[index] + 1  # store 1..n in color_grid
+        self.occ |= PIECE_MASK_AT[self.pieces[index]][gy * GRID_COLS + gx]
+        for dx, dy in pd.offsets:
+            self.color_grid[(gy+dy) * GRID_COLS + (gx+dx)] = color_id
+        placed_blocks = len(pd.offsets)
         self.used[index] = True
+        self._moves_dirty = True
         # particles
-        for _ in range(12):
-            cx = GRID_X + (gx + len(piece[0])/2)*CELL
-            cy = GRID_Y + (gy + len(piece)/2)*CELL
-            self.particles.append(Particle(cx + random.uniform(-8,8), cy + random.uniform(-8,8),
-                                           PARTICLE_COLORS[self.piece_colors[index]]))
+        cx = GRID_X + (gx + pd.w/2)*CELL
+        cy = GRID_Y + (gy + pd.h/2)*CELL
+        self.spawn_particles(cx, cy, self.piece_colors[index])
         # score for placing
         self.score += placed_blocks * SCORE_PER_BLOCK
         if SND_PLACE: SND_PLACE.play()
@@ -216,80 +302,100 @@ class Game:
         # if all three used, spawn new triplet
         if all(self.used):
             self.spawn_new_triplet()
-        # update highscore
+        # update highscore (written out later by flush_highscore)
         if self.score > self.highscore:
             self.highscore = self.score
-            save_highscore(self.highscore)
+            self._hs_dirty = True
         return True
 
     def clear_full_lines(self):
-        # check rows and cols; remove and cause collapse: standard block-puzzle clears entire row or column (set to 0)
+        # check rows and cols; remove: standard block-puzzle clears entire row or column (set to 0)
         cleared = 0
-        # rows
-        rows_to_clear = []
-        for y in range(GRID_ROWS):
-            full = True
-            for x in range(GRID_COLS):
-                if self.grid[x][y] == 0:
-                    full = False; break
-            if full:
-                rows_to_clear.append(y)
-        for y in rows_to_clear:
-            for x in range(GRID_COLS):
-                self.grid[x][y] = 0
-            cleared += 1
-        # columns
-        cols_to_clear = []
-        for x in range(GRID_COLS):
-            full = True
-            for y in range(GRID_ROWS):
-                if self.grid[x][y] == 0:
-                    full = False; break
-            if full:
-                cols_to_clear.append(x)
-        for x in cols_to_clear:
-            for y in range(GRID_ROWS):
-                self.grid[x][y] = 0
-            cleared += 1
-        # gravity collapse columns (blocks fall down within each column)
+        clear_mask = 0
+        occ = self.occ
+        for m in ROW_MASKS:
+            if (occ & m) == m:
+                clear_mask |= m
+                cleared += 1
+        for m in COL_MASKS:
+            if (occ & m) == m:
+                clear_mask |= m
+                cleared += 1
         if cleared > 0:
-            for x in range(GRID_COLS):
-                col = [self.grid[x][y] for y in range(GRID_ROWS) if self.grid[x][y] != 0]
-                newcol = [0]*(GRID_ROWS - len(col)) + col
-                for y in range(GRID_ROWS):
-                    self.grid[x][y] = newcol[y]
+            # classic block-puzzle rules: cleared cells just empty, no gravity
+            self.occ = occ & ~clear_mask
+            bb = clear_mask
+            while bb:
+                lsb = bb & -bb
+                self.color_grid[lsb.bit_length() - 1] = 0
+                bb ^= lsb
+            self._moves_dirty = True
         return cleared
 
+    def update_ghost(self, mouse_pos):
+        # recompute which piece would ghost at the hovered cell; called from
+        # MOUSEMOTION and after board changes, not per frame
+        self.ghost = None
+        g = screen_to_grid(*mouse_pos)
+        if not g:
+            return
+        gx, gy = g
+        for idx in range(3):
+            if not self.used[idx] and self.can_place_piece(self.pieces[idx], gx, gy):
+                self.ghost = (idx, gx, gy, mouse_pos[0], mouse_pos[1])
+                return
+
+    def flush_highscore(self, force=False):
+        if self._hs_dirty or force:
+            save_highscore(self.highscore)
+            self._hs_dirty = False
+
+    def spawn_particles(self, cx, cy, color_idx, count=12):
+        n = self.p_count
+        take = min(count, PARTICLE_CAP - n)
+        if take <= 0:
+            return
+        end = n + take
+        self.p_x[n:end] = cx + np.random.uniform(-8, 8, take)
+        self.p_y[n:end] = cy + np.random.uniform(-8, 8, take)
+        self.p_vx[n:end] = np.random.uniform(-140, 140, take)
+        self.p_vy[n:end] = np.random.uniform(-260, -80, take)
+        self.p_life[n:end] = np.random.uniform(0.45, 0.9, take)
+        self.p_size[n:end] = np.random.uniform(3, 6, take)
+        self.p_color[n:end] = color_idx
+        self.p_count = end
+
     def update_particles(self, dt):
-        for p in self.particles[:]:
-            p.update(dt)
-            if p.life <= 0:
-                try: self.particles.remove(p)
-                except ValueError: pass
+        # one vectorized pass over the live slice, then compact survivors down
+        n = self.p_count
+        if n == 0:
+            return
+        self.p_vy[:n] += 700 * dt
+        self.p_x[:n] += self.p_vx[:n] * dt
+        self.p_y[:n] += self.p_vy[:n] * dt
+        self.p_life[:n] -= dt
+        self.p_size[:n] *= 0.99
+        alive = self.p_life[:n] > 0
+        m = int(alive.sum())
+        if m != n:
+            for buf in (self.p_x, self.p_y, self.p_vx, self.p_vy,
+                        self.p_life, self.p_size, self.p_color):
+                buf[:m] = buf[:n][alive]
+            self.p_count = m
 
 # ----------------------- UI & drawing -----------------------
 def draw_board(game):
-    # background board
-    pygame.draw.rect(screen, BOARD_BG, (GRID_X-6, GRID_Y-6, GRID_COLS*CELL+12, GRID_ROWS*CELL+12), border_radius=10)
-    for x in range(GRID_COLS):
-        for y in range(GRID_ROWS):
-            rect = pygame.Rect(GRID_X + x*CELL + 3, GRID_Y + y*CELL + 3, CELL-6, CELL-6)
-            val = game.grid[x][y]
-            if val == 0:
-                pygame.draw.rect(screen, CELL_EMPTY, rect, border_radius=8)
-            else:
-                color = PARTICLE_COLORS[(val-1) % len(PARTICLE_COLORS)]
-                pygame.draw.rect(screen, color, rect, border_radius=9)
-                # gloss
-                inner = rect.inflate(-8, -8)
-                s = pygame.Surface((inner.w, inner.h), pygame.SRCALPHA)
-                pygame.draw.ellipse(s, (255,255,255,26), (0,0,inner.w, inner.h//2))
-                screen.blit(s, inner.topleft)
-    # grid lines subtle
-    for i in range(GRID_COLS+1):
-        pygame.draw.line(screen, LINE, (GRID_X + i*CELL, GRID_Y), (GRID_X + i*CELL, GRID_Y + GRID_ROWS*CELL))
-    for j in range(GRID_ROWS+1):
-        pygame.draw.line(screen, LINE, (GRID_X, GRID_Y + j*CELL), (GRID_X + GRID_COLS*CELL, GRID_Y + j*CELL))
+    # background board (panel + empty cells pre-rendered once)
+    screen.blit(BOARD_SURF, (GRID_X-6, GRID_Y-6))
+    # walk only the occupied cells via lsb extraction on the bitboard
+    bb = game.occ
+    while bb:
+        lsb = bb & -bb
+        i = lsb.bit_length() - 1
+        sprite = BLOCK_SPRITES[(game.color_grid[i]-1) % len(BLOCK_SPRITES)]
+        screen.blit(sprite, (GRID_X + (i % GRID_COLS)*CELL + 3,
+                             GRID_Y + (i // GRID_COLS)*CELL + 3))
+        bb ^= lsb
 
 def draw_preview(game):
     # preview area top
@@ -301,10 +407,10 @@ def draw_preview(game):
         py = start_y
         # draw box
         pygame.draw.rect(screen, (28,28,34), (px-10, py-10, 180, 140), border_radius=10)
-        label = FONT.render(f"Piece {idx+1}" + (" (used)" if game.used[idx] else ""), True, TEXT)
+        label = render_text(FONT, f"Piece {idx+1}" + (" (used)" if game.used[idx] else ""), TEXT)
         screen.blit(label, (px, py-34))
         # draw piece cells in center of box
-        piece = game.pieces[idx]
+        piece = PIECES[game.pieces[idx]]
         color_idx = game.piece_colors[idx]
         cols = len(piece[0]); rows = len(piece)
         cell_size = 22
@@ -319,44 +425,39 @@ def draw_preview(game):
                 else:
                     pygame.draw.rect(screen, (18,18,22), rect, border_radius=4)
     # score and instructions top-left
-    score_txt = BIG.render(f"Score: {game.score}", True, TEXT)
+    score_txt = render_text(BIG, f"Score: {game.score}", TEXT)
     screen.blit(score_txt, (20, 20))
-    hs_txt = FONT.render(f"Best: {game.highscore}", True, (200,200,210))
+    hs_txt = render_text(FONT, f"Best: {game.highscore}", (200,200,210))
     screen.blit(hs_txt, (20, 64))
-    instr = FONT.render("Click a cell to place selected piece (top-left). R restart  S save  Esc quit.", True, (180,180,190))
+    instr = render_text(FONT, "Click a cell to place selected piece (top-left). R restart  S save  Esc quit.", (180,180,190))
     screen.blit(instr, (20, 104))
 
-def draw_ghost_piece(game, mouse_pos):
-    # if hovering over board and hovering cell and selected piece not used - show ghost placement for piece under mouse when hovering which piece?
-    # We'll show best ghost for the first non-used piece that fits at mouse cell.
-    mx, my = mouse_pos
-    g = screen_to_grid(mx, my)
-    if not g:
+def draw_ghost_piece(game):
+    # the first non-used piece that fits at the hovered cell is cached on the
+    # game by update_ghost; here we only blit it
+    if game.ghost is None:
         return
-    gx, gy = g
-    # iterate preview indices; if user hovers near preview boxes, we won't choose piece by index; rather show ghost for each piece where mouse is
-    for idx in range(3):
-        if game.used[idx]:
-            continue
-        piece = game.pieces[idx]
-        h = len(piece); w = len(piece[0])
-        # show ghost only if top-left at (gx,gy) would be fully inside grid bounds for the piece
-        if gx + w <= GRID_COLS and gy + h <= GRID_ROWS and game.can_place_piece(piece, gx, gy):
-            # draw semi-transparent overlay on target cells
-            s = pygame.Surface((CELL-6, CELL-6), pygame.SRCALPHA)
-            color = PARTICLE_COLORS[game.piece_colors[idx] % len(PARTICLE_COLORS)]
-            s.fill((*color, 120))
-            for py in range(h):
-                for px in range(w):
-                    if piece[py][px]:
-                        rx = GRID_X + (gx+px)*CELL + 3
-                        ry = GRID_Y + (gy+py)*CELL + 3
-                        screen.blit(s, (rx, ry))
-            # show a small index marker near mouse
-            mark = FONT.render(f"P{idx+1}", True, TEXT)
-            screen.blit(mark, (mx+12, my+6))
-            # only show the first valid ghost (keeps interface clear)
-            break
+    idx, gx, gy, mx, my = game.ghost
+    pd = PIECE_DEFS[game.pieces[idx]]
+    # draw semi-transparent overlay on target cells
+    s = pygame.Surface((CELL-6, CELL-6), pygame.SRCALPHA)
+    color = PARTICLE_COLORS[game.piece_colors[idx] % len(PARTICLE_COLORS)]
+    s.fill((*color, 120))
+    for dx, dy in pd.offsets:
+        rx = GRID_X + (gx+dx)*CELL + 3
+        ry = GRID_Y + (gy+dy)*CELL + 3
+        screen.blit(s, (rx, ry))
+    # show a small index marker near mouse
+    mark = render_text(FONT, f"P{idx+1}", TEXT)
+    screen.blit(mark, (mx+12, my+6))
+
+def draw_particles(game):
+    # circle draws stay Python-side; the motion math is vectorized in update
+    n = game.p_count
+    xs = game.p_x; ys = game.p_y; sizes = game.p_size; cols = game.p_color
+    for i in range(n):
+        r = max(1, int(sizes[i]))
+        pygame.draw.circle(screen, PARTICLE_COLORS[cols[i]], (int(xs[i]), int(ys[i])), r)
 
 def screen_to_grid(mx, my):
     gx = (mx - GRID_X) // CELL
@@ -366,32 +467,31 @@ def screen_to_grid(mx, my):
     return None
 
 def draw_game_over(game):
-    surf = BIG.render("GAME OVER", True, (240,120,120))
+    surf = render_text(BIG, "GAME OVER", (240,120,120))
     rect = surf.get_rect(center=(SCREEN_W//2, 100))
     screen.blit(surf, rect)
-    info = FONT.render("No possible placement for any piece. Press R to restart or Esc to quit.", True, (220,200,200))
+    info = render_text(FONT, "No possible placement for any piece. Press R to restart or Esc to quit.", (220,200,200))
     rect2 = info.get_rect(center=(SCREEN_W//2, 140))
     screen.blit(info, rect2)
 
 # ----------------------- Main Menu -----------------------
 def draw_menu(selected):
     screen.fill(BG)
-    title_s = TITLE.render("Block Puzzle", True, ACCENT)
+    title_s = render_text(TITLE, "Block Puzzle", ACCENT)
     screen.blit(title_s, ((SCREEN_W - title_s.get_width())//2, 60))
-    options = ["Start", "Highscore", "Quit"]
-    for i, opt in enumerate(options):
+    for i, opt in enumerate(MENU_OPTIONS):
         y = 220 + i*86
         color = TEXT if i == selected else (170,170,170)
-        txt = BIG.render(opt, True, color)
+        txt = render_text(BIG, opt, color)
         screen.blit(txt, ((SCREEN_W - txt.get_width())//2, y))
 
 def draw_highscore_screen(hs):
     screen.fill(BG)
-    t = TITLE.render("High Score", True, (210,210,255))
+    t = render_text(TITLE, "High Score", (210,210,255))
     screen.blit(t, ((SCREEN_W - t.get_width())//2, 60))
-    score_txt = BIG.render(str(hs), True, TEXT)
+    score_txt = render_text(BIG, str(hs), TEXT)
     screen.blit(score_txt, ((SCREEN_W - score_txt.get_width())//2, 220))
-    sub = FONT.render("Press Backspace to return", True, (180,180,200))
+    sub = render_text(FONT, "Press Backspace to return", (180,180,200))
     screen.blit(sub, ((SCREEN_W - sub.get_width())//2, SCREEN_H - 90))
 
 # ----------------------- Main Loop -----------------------
@@ -400,7 +500,10 @@ def main():
     running = True
     state = "menu"  # menu, play, highscore
     selected_menu = 0
-    mouse_pos = (0,0)
+    last_hs_save = 0
+    # only repaint when something on screen can have changed: an event came in
+    # (including mouse motion, which drives the ghost) or particles are animating
+    needs_redraw = True
 
     # attempt to play background music if exists
     try:
@@ -413,10 +516,12 @@ def main():
 
     while running:
         dt = clock.tick(FPS)/1000.0
-        mouse_pos = pygame.mouse.get_pos()
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        if events:
+            needs_redraw = True
+        for event in events:
             if event.type == pygame.QUIT:
-                save_highscore(game.highscore)
+                game.flush_highscore()
                 running = False
             elif event.type == pygame.KEYDOWN:
                 if state == "menu":
@@ -431,35 +536,35 @@ def main():
                         elif selected_menu == 1:
                             state = "highscore"
                         elif selected_menu == 2:
-                            save_highscore(game.highscore)
+                            game.flush_highscore()
                             running = False
                 elif state == "highscore":
                     if event.key in (pygame.K_BACKSPACE, pygame.K_ESCAPE):
                         state = "menu"
                 elif state == "play":
                     if event.key == pygame.K_r:
+                        game.flush_highscore()
                         game.reset()
                     elif event.key == pygame.K_s:
-                        save_highscore(game.highscore)
+                        game.flush_highscore(force=True)
                     elif event.key == pygame.K_ESCAPE:
-                        save_highscore(game.highscore)
+                        game.flush_highscore()
                         state = "menu"
+            elif event.type == pygame.MOUSEMOTION:
+                if state == "play":
+                    game.update_ghost(event.pos)
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if state == "menu":
                     mx,my = event.pos
                     # clicking option area
-                    for i in range(3):
-                        rect_y = 220 + i*86
-                        text = ["Start","Highscore","Quit"][i]
-                        txt = BIG.render(text, True, TEXT)
-                        rect = pygame.Rect((SCREEN_W - txt.get_width())//2, rect_y, txt.get_width(), txt.get_height())
+                    for i, rect in enumerate(MENU_RECTS):
                         if rect.collidepoint(mx,my):
                             if i == 0:
                                 game.reset(); state = "play"
                             elif i == 1:
                                 state = "highscore"
                             else:
-                                save_highscore(game.highscore); running = False
+                                game.flush_highscore(); running = False
                 elif state == "play":
                     if event.button == 1 and not game.game_over:
                         pos = event.pos
@@ -473,24 +578,32 @@ def main():
                                     success = game.place_piece(i, gx, gy)
                                     placed_any = placed_any or success
                                     break
+                            # board changed: refresh the cached ghost
+                            game.update_ghost(pos)
                             # after any placement, check game over condition
                             if not game.any_move_exists():
                                 game.game_over = True
                     # right-click to optionally cycle through pieces? (not necessary)
         # Update
         if state == "play":
+            if game.p_count > 0:
+                needs_redraw = True  # particles animating (also erases the last one)
             game.update_particles(dt)
-            # update particles positions handled inside game
-            if not game.game_over:
-                # check if none of the three pieces can be placed -> game over
-                if not game.any_move_exists():
-                    game.game_over = True
-            # update global highscore
+            # game-over detection happens after each placement in the click
+            # handler; the board cannot change between clicks
+            # update global highscore; flush to disk at most every few seconds
             if game.score > game.highscore:
                 game.highscore = game.score
-                save_highscore(game.highscore)
+                game._hs_dirty = True
+            now = pygame.time.get_ticks()
+            if now - last_hs_save > 5000:
+                game.flush_highscore()
+                last_hs_save = now
 
         # Draw
+        if not needs_redraw:
+            continue
+        needs_redraw = False
         screen.fill(BG)
         if state == "menu":
             draw_menu(selected_menu)
@@ -499,10 +612,8 @@ def main():
         elif state == "play":
             draw_preview(game)
             draw_board(game)
-            draw_ghost_piece(game, mouse_pos)
-            # draw particles
-            for p in game.particles:
-                p.draw(screen)
+            draw_ghost_piece(game)
+            draw_particles(game)
             if game.game_over:
                 draw_game_over(game)
 